@@ -1,10 +1,11 @@
 import os
-import runpy
 import sys
 
 if __name__ == "__main__":
     src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "src"))
     sys.path.insert(0, src_path)
 
-    # Запускаем модуль
-    runpy.run_module("pawlette.cli.main", run_name="__main__")
+    # Вызываем точку входа напрямую, без повторного исполнения модуля через runpy
+    from pawlette.cli.main import main
+
+    main()
@@ -3,18 +3,17 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import sys
+from typing import TYPE_CHECKING
 
 from pawlette.cli.migration import migrate_from_v1
 from pawlette.core import xdg
-from pawlette.extraction import DEFAULT_BACKEND
-from pawlette.extraction import DEFAULT_MODE
-from pawlette.extraction import Palette
-from pawlette.extraction import extract_from_hex
-from pawlette.extraction import extract_from_image
-from pawlette.plugins import run_plugins
-from pawlette.rendering import apply_templates
-from pawlette.rendering.themes import list_theme_variants
+
+# Extraction, rendering and plugin modules are imported inside the commands
+# that use them so that e.g. `pawlette list` doesn't pay for the whole graph.
+if TYPE_CHECKING:
+    from pawlette.extraction import Palette
 
 
 def _setup_logging(verbose: bool) -> None:
@@ -30,10 +29,16 @@ def _setup_logging(verbose: bool) -> None:
 def _save_palette(palette: Palette) -> None:
     path = xdg.active_palette_file()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(palette.to_dict(), indent=2), encoding="utf-8")
+    # Encode fully, write once, then swap in: an interrupted apply can't leave
+    # a truncated cache behind for the next `render`.
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(palette.to_dict(), indent=2), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def _load_palette() -> Palette | None:
+    from pawlette.extraction import Palette
+
     path = xdg.active_palette_file()
     if not path.exists():
         return None
@@ -78,11 +83,13 @@ def _print_palette(palette: Palette, mode: str = "", backend: str = "") -> None:
             ],
         )
     )
+    # Collect everything and write once instead of one print() per swatch
+    lines: list[str] = []
     if meta:
-        print(f"\n  [{meta}]")
+        lines.append(f"\n  [{meta}]")
     d = palette.to_dict()
     for group_name, fields in groups:
-        print(f"\n  {group_name}")
+        lines.append(f"\n  {group_name}")
         for f in fields:
             hex_val = d.get(f, "?")
             if len(hex_val) == 7 and hex_val.startswith("#"):
@@ -94,8 +101,9 @@ def _print_palette(palette: Palette, mode: str = "", backend: str = "") -> None:
                 swatch = f"\x1b[48;2;{r};{g};{b}m  \x1b[0m"
             else:
                 swatch = "  "
-            print(f"    {swatch} {f:<28} {hex_val}")
-    print()
+            lines.append(f"    {swatch} {f:<28} {hex_val}")
+    lines.append("")
+    print("\n".join(lines))
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +116,12 @@ def cmd_apply(args: argparse.Namespace) -> int:
 
     # Load config
     from pawlette.core import config as cfg
+    from pawlette.extraction import DEFAULT_BACKEND
+    from pawlette.extraction import DEFAULT_MODE
+    from pawlette.extraction import extract_from_hex
+    from pawlette.extraction import extract_from_image
+    from pawlette.plugins import run_plugins
+    from pawlette.rendering import apply_templates
 
     user_config = cfg.load_config()
 
@@ -171,7 +185,11 @@ def cmd_apply(args: argparse.Namespace) -> int:
                 log.info("  %s", p)
 
     if not args.skip_plugins and not args.dry_run:
-        results = run_plugins(palette, plugins_dir=xdg.plugins_dir())
+        results = run_plugins(
+            palette,
+            plugins_dir=xdg.plugins_dir(),
+            jobs=cfg.get_plugin_jobs(user_config),
+        )
         failed = [name for name, ok in results.items() if not ok]
         if failed:
             log.warning("Failed plugins: %s", ", ".join(failed))
@@ -185,6 +203,7 @@ DEFAULT_TOML = """\
 
 backend = "native"   # native or matugen
 mode = "dark"        # dark or light
+plugin_jobs = 1      # plugins run concurrently (1 = sequential)
 
 [backends.matugen]
 prefer = "saturation"
@@ -196,17 +215,23 @@ def cmd_generate_config(_args: argparse.Namespace) -> int:
     log = logging.getLogger(__name__)
     config_path = xdg.config_dir() / "pawlette.toml"
 
-    if config_path.exists():
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    # Exclusive create: one open() both checks for and writes the file
+    try:
+        with config_path.open("x", encoding="utf-8") as f:
+            f.write(DEFAULT_TOML)
+    except FileExistsError:
         log.info("Config already exists at %s — not overwriting", config_path)
         return 0
 
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(DEFAULT_TOML, encoding="utf-8")
     log.info("Created default config at %s", config_path)
     return 0
 
 
 def cmd_render(args: argparse.Namespace) -> int:
+    from pawlette.plugins import run_plugins
+    from pawlette.rendering import apply_templates
+
     log = logging.getLogger(__name__)
     palette = _load_palette()
     if palette is None:
@@ -227,35 +252,37 @@ def cmd_render(args: argparse.Namespace) -> int:
     log.info("Rendered %d template(s)", len(written))
 
     if not args.skip_plugins and not args.dry_run:
-        run_plugins(palette, plugins_dir=xdg.plugins_dir())
+        from pawlette.core import config as cfg
+
+        run_plugins(
+            palette,
+            plugins_dir=xdg.plugins_dir(),
+            jobs=cfg.get_plugin_jobs(cfg.load_config()),
+        )
 
     return 0
 
 
 def cmd_list(_args: argparse.Namespace) -> int:
+    from pawlette.rendering.themes import list_theme_variants
+    from pawlette.rendering.themes import list_themes
+
     themes_path = xdg.themes_dir()
     if not themes_path.exists():
         print(f"No themes directory found at {themes_path}")
         return 1
 
-    themes = sorted(
-        [
-            d.name
-            for d in themes_path.iterdir()
-            if d.is_dir() and (d / "colors.toml").exists()
-        ]
-    )
+    themes = list_themes(themes_path)
 
     if not themes:
         print(f"No themes found in {themes_path}")
         return 0
 
+    lines = []
     for theme in themes:
         variants = list_theme_variants(theme, themes_path)
-        if variants:
-            print(f"{theme} ({', '.join(variants)})")
-        else:
-            print(theme)
+        lines.append(f"{theme} ({', '.join(variants)})" if variants else theme)
+    print("\n".join(lines))
 
     return 0
 
@@ -287,13 +314,7 @@ def _add_common(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-v", "--verbose", action="store_true", default=False)
 
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="pawlette", description="Theme management utility for Linux desktops."
-    )
-    _add_common(parser)
-    sub = parser.add_subparsers(dest="command", required=True)
-
+def _add_apply_parser(sub: argparse._SubParsersAction) -> None:
     apply_p = sub.add_parser("apply", help="Apply a palette from a source")
     apply_p.add_argument("source", choices=["image", "hex", "theme"])
     apply_p.add_argument("value", help="Path / hex colour / theme name")
@@ -343,32 +364,84 @@ def _build_parser() -> argparse.ArgumentParser:
     apply_p.add_argument("--print-palette", action="store_true")
     _add_common(apply_p)
 
+
+def _add_render_parser(sub: argparse._SubParsersAction) -> None:
     render_p = sub.add_parser("render", help="Re-render templates from cached palette")
     render_p.add_argument("--dry-run", action="store_true")
     render_p.add_argument("--skip-plugins", action="store_true")
     render_p.add_argument("--print-palette", action="store_true")
     _add_common(render_p)
 
+
+def _add_list_parser(sub: argparse._SubParsersAction) -> None:
     list_p = sub.add_parser("list", help="List available themes")
     _add_common(list_p)
 
+
+def _add_migrate_parser(sub: argparse._SubParsersAction) -> None:
     migrate_p = sub.add_parser(
         "migrate-from-v1",
         help="Migrate pawlette from v1 to the current version",
     )
     _add_common(migrate_p)
 
+
+def _add_generate_config_parser(sub: argparse._SubParsersAction) -> None:
     config_p = sub.add_parser(
         "generate-config",
         help="Create default pawlette.toml configuration",
     )
     _add_common(config_p)
 
+
+# Subcommand name → function registering its subparser
+_SUBPARSERS = {
+    "apply": _add_apply_parser,
+    "render": _add_render_parser,
+    "list": _add_list_parser,
+    "migrate-from-v1": _add_migrate_parser,
+    "generate-config": _add_generate_config_parser,
+}
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When *command* names a known subcommand only that subparser is
+    registered; otherwise (no command, -h, leading options, typos) all of
+    them are, so help and error messages stay complete.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pawlette", description="Theme management utility for Linux desktops."
+    )
+    _add_common(parser)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    if command in _SUBPARSERS:
+        _SUBPARSERS[command](sub)
+    else:
+        for add_parser in _SUBPARSERS.values():
+            add_parser(sub)
+
     return parser
 
 
+# Option-less commands that are dispatched without building the parser when
+# invoked bare (`pawlette list` is polled by status bars and scripts).
+_FAST_PATHS = {
+    "list": cmd_list,
+    "generate-config": cmd_generate_config,
+}
+
+
 def main() -> None:
-    parser = _build_parser()
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in _FAST_PATHS:
+        _setup_logging(False)
+        args = argparse.Namespace(command=argv[0], verbose=False)
+        sys.exit(_FAST_PATHS[argv[0]](args))
+
+    parser = _build_parser(argv[0] if argv else None)
     args = parser.parse_args()
     _setup_logging(args.verbose)
     handlers = {
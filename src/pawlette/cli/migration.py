@@ -25,9 +25,9 @@ def migrate_from_v1():
         shutil.rmtree(logs_dir)
 
     # 3. Удаляем симлинк theme_wallpapers
+    # unlink() works on dangling links too, no need to stat first
     wallpaper_link = share_dir / "theme_wallpapers"
-    if wallpaper_link.is_symlink() or wallpaper_link.exists():
-        wallpaper_link.unlink()
+    wallpaper_link.unlink(missing_ok=True)
 
     # 4. Чистим темы
     if themes_dir.is_dir():
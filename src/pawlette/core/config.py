@@ -75,3 +75,15 @@ def get_default_mode(config: dict[str, Any]) -> str | None:
     Returns None if not configured (caller should use hardcoded default).
     """
     return config.get("mode")
+
+
+def get_plugin_jobs(config: dict[str, Any]) -> int:
+    """Get how many plugins may run concurrently.
+
+    Defaults to 1 (sequential) when not configured or invalid.
+    """
+    try:
+        return max(1, int(config.get("plugin_jobs", 1)))
+    except (TypeError, ValueError):
+        log.warning("Invalid plugin_jobs value %r — using 1", config.get("plugin_jobs"))
+        return 1
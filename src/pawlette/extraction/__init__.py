@@ -17,8 +17,6 @@ import logging
 from pathlib import Path
 from typing import Any, Literal
 
-from .matugen import extract_matugen
-from .native import extract_native
 from .palette import Mode, Palette
 
 Backend = Literal["native", "matugen"]
@@ -31,6 +29,20 @@ log = logging.getLogger(__name__)
 __all__ = ["Palette", "Mode", "Backend", "extract_from_image", "extract_from_hex", "extract_native", "extract_matugen"]
 
 
+def __getattr__(name: str) -> Any:
+    # Backends are imported on first use: importing Palette (e.g. for theme
+    # loading or `pawlette list`) shouldn't pull in subprocess/json/PIL glue.
+    if name == "extract_native":
+        from .native import extract_native
+
+        return extract_native
+    if name == "extract_matugen":
+        from .matugen import extract_matugen
+
+        return extract_matugen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def extract_from_image(
     wallpaper: str | Path,
     mode: Mode = DEFAULT_MODE,
@@ -54,7 +66,12 @@ def extract_from_image(
     wallpaper_path = Path(wallpaper).resolve()
 
     if backend == "native":
+        from .native import extract_native
+
         return extract_native(wallpaper_path, mode=mode)
+
+    from .matugen import extract_matugen
+
     return extract_matugen("image", str(wallpaper_path), mode=mode, matugen_config=backend_config)
 
 
@@ -81,4 +98,6 @@ def extract_from_hex(
         log.warning(
             "Native backend does not support hex seed — falling back to matugen."
         )
+    from .matugen import extract_matugen
+
     return extract_matugen("color", "hex", hex_color, mode=mode, matugen_config=backend_config)
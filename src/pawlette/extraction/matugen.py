@@ -3,6 +3,8 @@ from __future__ import annotations
 import colorsys
 import json
 import logging
+import os
+import shutil
 import subprocess
 from typing import Any
 
@@ -64,10 +66,18 @@ def _run_matugen(
             fallback = matugen_config.get("fallback_color", "#cba6f7")  # default purple
             cmd.extend(["--fallback-color", fallback])
 
+    key = _cache_key(cmd)
+    if key is not None:
+        cached = _read_cache(key)
+        if cached is not None:
+            log.debug("Using cached matugen output for: %s", " ".join(cmd))
+            return cached
+
     log.debug("Running matugen: %s", " ".join(cmd))
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Keep stdout as bytes: json.loads() decodes UTF-8 itself
+        result = subprocess.run(cmd, capture_output=True, check=True)
     except FileNotFoundError as exc:
         raise RuntimeError(
             "matugen is not installed or not in PATH. "
@@ -75,9 +85,70 @@ def _run_matugen(
         ) from exc
     except subprocess.CalledProcessError as exc:
         raise RuntimeError(
-            f"matugen failed (exit {exc.returncode}):\n{exc.stderr.strip()}"
+            f"matugen failed (exit {exc.returncode}):\n"
+            f"{exc.stderr.decode(errors='replace').strip()}"
         ) from exc
-    return json.loads(result.stdout)
+    raw = json.loads(result.stdout)
+    if key is not None:
+        _write_cache(key, raw)
+    return raw
+
+
+# ---------------------------------------------------------------------------
+# Output cache
+# ---------------------------------------------------------------------------
+
+
+def _cache_key(cmd: list[str]) -> list[Any] | None:
+    """Identify a matugen run: the resolved binary (path, mtime, size) so an
+    upgrade misses, the full command, and for images the source file's mtime
+    and size so an edited/replaced wallpaper misses.
+
+    Returns None if the binary or source can't be stat'ed (matugen will
+    report it).
+    """
+    binary = shutil.which(cmd[0])
+    if binary is None:
+        return None
+    try:
+        bin_st = os.stat(binary)
+    except OSError:
+        return None
+    key: list[Any] = [binary, bin_st.st_mtime_ns, bin_st.st_size, *cmd]
+    if cmd[1] == "image":
+        try:
+            st = os.stat(cmd[2])
+        except OSError:
+            return None
+        key += [st.st_mtime_ns, st.st_size]
+    return key
+
+
+def _read_cache(key: list[Any]) -> dict[str, Any] | None:
+    from pawlette.core import xdg
+
+    try:
+        cached = json.loads(xdg.matugen_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("output")
+
+
+def _write_cache(key: list[Any], raw: dict[str, Any]) -> None:
+    from pawlette.core import xdg
+
+    path = xdg.matugen_cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then swap in, so a concurrent/interrupted run never reads a
+        # truncated cache
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({"key": key, "output": raw}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        log.debug("Could not write matugen cache %s: %s", path, exc)
 
 
 def _pick(colors: dict[str, Any], *keys: str, mode: Mode) -> str:
@@ -4,6 +4,7 @@ import logging
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,10 +14,12 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-def _load_plugin_config(config_dir: Path, plugin_stem: str) -> dict[str, str]:
-    """Read [plugins.<plugin_stem>] section from pawlette.toml.
+def _load_plugin_config(config_dir: Path) -> dict[str, dict[str, str]]:
+    """Read all [plugins.<stem>] sections from pawlette.toml.
 
-    Returns a flat dict of string values, or empty dict if not found.
+    Returns a mapping of plugin stem to a flat dict of string values, or an
+    empty dict if the file or section is missing. Parsed once per run and
+    shared by every plugin.
     """
     try:
         import tomllib
@@ -32,10 +35,13 @@ def _load_plugin_config(config_dir: Path, plugin_stem: str) -> dict[str, str]:
 
     try:
         data = tomllib.loads(toml_path.read_text(encoding="utf-8"))
-        section = data.get("plugins", {}).get(plugin_stem, {})
-        return {k: str(v) for k, v in section.items()}
+        return {
+            stem: {k: str(v) for k, v in section.items()}
+            for stem, section in data.get("plugins", {}).items()
+            if isinstance(section, dict)
+        }
     except Exception as exc:
-        log.warning("Could not read plugin config for %r: %s", plugin_stem, exc)
+        log.warning("Could not read plugin config from %s: %s", toml_path, exc)
         return {}
 
 
@@ -51,12 +57,60 @@ def _build_cmd(plugin: Path) -> list[str]:
     return [str(plugin)]
 
 
+def _run_plugin(
+    plugin: Path, env: dict[str, str], plugin_cfg: dict[str, str], timeout: int
+) -> bool:
+    """Run a single *plugin* and return True on success."""
+    log.info("Running plugin: %s", plugin.name)
+    cmd = _build_cmd(plugin)
+
+    # Inject [plugins.<stem>] config as PAWLETTE_PLUGIN_* env vars
+    plugin_env = env.copy()
+    for key, value in plugin_cfg.items():
+        env_key = "PAWLETTE_PLUGIN_" + key.upper()
+        plugin_env[env_key] = value
+        log.debug("  %s=%s", env_key, value)
+
+    # stdout is only ever logged at DEBUG level — don't pipe it otherwise
+    want_stdout = log.isEnabledFor(logging.DEBUG)
+    try:
+        result = subprocess.run(
+            cmd,
+            env=plugin_env,
+            timeout=timeout,
+            stdout=subprocess.PIPE if want_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except subprocess.TimeoutExpired:
+        log.error("Plugin %s timed out after %ds", plugin.name, timeout)
+        return False
+    except OSError as exc:
+        log.error("Plugin %s could not be executed: %s", plugin.name, exc)
+        return False
+
+    if result.returncode != 0:
+        log.warning(
+            "Plugin %s exited with code %d:\n%s",
+            plugin.name,
+            result.returncode,
+            result.stderr.strip(),
+        )
+        return False
+
+    log.info("Plugin %s OK", plugin.name)
+    if want_stdout and result.stdout.strip():
+        log.debug("Plugin %s stdout:\n%s", plugin.name, result.stdout.strip())
+    return True
+
+
 def run_plugins(
     palette: "Palette",
     plugins_dir: Path,
     config_dir: Path | None = None,
     *,
     timeout: int = 30,
+    jobs: int = 1,
 ) -> dict[str, bool]:
     """Execute all executable files in *plugins_dir* with palette env vars.
 
@@ -71,6 +125,11 @@ def run_plugins(
         Defaults to ~/.config/pawlette.
     timeout:
         Per-plugin timeout in seconds.
+    jobs:
+        Maximum number of plugins run at the same time. The default of 1
+        runs them sequentially in filename order; larger values let
+        independent reload hooks overlap so the total wait is roughly the
+        slowest plugin rather than the sum of all of them.
 
     Returns
     -------
@@ -89,58 +148,33 @@ def run_plugins(
     env = os.environ.copy()
     env.update(palette.to_env())
 
-    results: dict[str, bool] = {}
-
-    plugins = sorted(
-        p
-        for p in plugins_dir.iterdir()
-        if p.is_file() and (p.suffix == ".py" or os.access(p, os.X_OK))
-    )
+    with os.scandir(plugins_dir) as it:
+        plugins = sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.is_file()
+            and (entry.name.endswith(".py") or os.access(entry.path, os.X_OK))
+        )
 
     if not plugins:
         log.debug("No executable plugins found in %s", plugins_dir)
         return {}
 
-    for plugin in plugins:
-        log.info("Running plugin: %s", plugin.name)
-        cmd = _build_cmd(plugin)
+    plugins_cfg = _load_plugin_config(config_dir)
 
-        # Inject [plugins.<stem>] config as PAWLETTE_PLUGIN_* env vars
-        plugin_env = env.copy()
-        plugin_cfg = _load_plugin_config(config_dir, plugin.stem)
-        for key, value in plugin_cfg.items():
-            env_key = "PAWLETTE_PLUGIN_" + key.upper()
-            plugin_env[env_key] = value
-            log.debug("  %s=%s", env_key, value)
+    if jobs <= 1 or len(plugins) == 1:
+        return {
+            plugin.name: _run_plugin(
+                plugin, env, plugins_cfg.get(plugin.stem, {}), timeout
+            )
+            for plugin in plugins
+        }
 
-        try:
-            result = subprocess.run(
-                cmd,
-                env=plugin_env,
-                timeout=timeout,
-                capture_output=True,
-                text=True,
+    with ThreadPoolExecutor(max_workers=min(jobs, len(plugins))) as pool:
+        futures = [
+            pool.submit(
+                _run_plugin, plugin, env, plugins_cfg.get(plugin.stem, {}), timeout
             )
-            if result.returncode == 0:
-                log.info("Plugin %s OK", plugin.name)
-                if result.stdout.strip():
-                    log.debug(
-                        "Plugin %s stdout:\n%s", plugin.name, result.stdout.strip()
-                    )
-                results[plugin.name] = True
-            else:
-                log.warning(
-                    "Plugin %s exited with code %d:\n%s",
-                    plugin.name,
-                    result.returncode,
-                    result.stderr.strip(),
-                )
-                results[plugin.name] = False
-        except subprocess.TimeoutExpired:
-            log.error("Plugin %s timed out after %ds", plugin.name, timeout)
-            results[plugin.name] = False
-        except OSError as exc:
-            log.error("Plugin %s could not be executed: %s", plugin.name, exc)
-            results[plugin.name] = False
-
-    return results
+            for plugin in plugins
+        ]
+        return {plugin.name: f.result() for plugin, f in zip(plugins, futures)}
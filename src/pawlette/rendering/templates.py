@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import colorsys
+import functools
 import logging
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -64,34 +67,41 @@ def _darken(hex_color: str, amount: float) -> str:
     return _rgb_to_hex(round(r2 * 255), round(g2 * 255), round(b2 * 255)) + suffix
 
 
+def _rgb_triplet(hex_color: str) -> str:
+    r, g, b = _hex_to_rgb(hex_color)
+    return f"{r},{g},{b}"
+
+
+# Filter name → fn(value, arg). A dict lookup instead of a `match` chain of
+# string compares, since this runs for every filter segment of every token.
+_FILTERS: dict[str, Callable[[str, float | None], str]] = {
+    "alpha": lambda value, arg: _apply_alpha(value, arg or 100),
+    "lighten": lambda value, arg: _lighten(value, arg or 10),
+    "darken": lambda value, arg: _darken(value, arg or 10),
+    "strip": lambda value, _arg: value.lstrip("#"),
+    "rgb": lambda value, _arg: _rgb_triplet(value),
+    "uppercase": lambda value, _arg: value.upper(),
+}
+
+
 def _apply_single_filter(value: str, filter_name: str, filter_arg: str | None) -> str:
     """Apply one filter to *value* (which may already be non-hex after strip/rgb)."""
-    arg = float(filter_arg) if filter_arg is not None else None
-
-    match filter_name:
-        case "alpha":
-            return _apply_alpha(value, arg or 100)
-        case "lighten":
-            return _lighten(value, arg or 10)
-        case "darken":
-            return _darken(value, arg or 10)
-        case "strip":
-            return value.lstrip("#")
-        case "rgb":
-            r, g, b = _hex_to_rgb(value)
-            return f"{r},{g},{b}"
-        case "uppercase":
-            return value.upper()
-        case _:
-            log.warning("Unknown filter %r — skipping", filter_name)
-            return value
+    fn = _FILTERS.get(filter_name)
+    if fn is None:
+        log.warning("Unknown filter %r — skipping", filter_name)
+        return value
+    return fn(value, float(filter_arg) if filter_arg is not None else None)
 
 
+@functools.lru_cache(maxsize=1024)
 def _apply_filter_chain(hex_color: str, raw_chain: str) -> str:
     """Parse and apply a `|`-separated filter chain to *hex_color*.
 
     Each segment is "filtername [arg]", e.g. "darken 15" or "strip".
     Filters are applied left-to-right.
+
+    Memoised: the same token (e.g. ``{{color_bg | alpha 80}}``) typically
+    appears in many templates, and the result only depends on the inputs.
     """
     value = hex_color
     for segment in raw_chain.split("|"):
@@ -143,6 +153,30 @@ def _render_template(template: str, palette_dict: dict[str, str]) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _read_existing(path: Path) -> str | None:
+    """Current contents of a render target, or None if missing/unreadable."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _find_templates(root: Path) -> list[Path]:
+    """Return every *.pawlette file under *root*, sorted.
+
+    Walks with os.walk (scandir + d_type) instead of Path.rglob so the many
+    unrelated entries under ~/.config never become Path objects. Like rglob,
+    symlinked directories are not descended into.
+    """
+    found: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".pawlette"):
+                found.append(Path(dirpath, name))
+    found.sort()
+    return found
+
+
 def apply_templates(
     palette: "Palette",
     config_root: str | Path | None = None,
@@ -171,8 +205,11 @@ def apply_templates(
 
     palette_dict = palette.to_dict()
     written: list[Path] = []
+    # Targets sit next to their templates, so the parent almost always
+    # exists; only ask the filesystem once per distinct directory.
+    known_dirs: set[Path] = set()
 
-    for template_path in sorted(config_root.rglob("*.pawlette")):
+    for template_path in _find_templates(config_root):
         target_path = template_path.with_suffix("")  # strip .pawlette
 
         try:
@@ -183,9 +220,16 @@ def apply_templates(
 
         rendered = _render_template(raw, palette_dict)
 
-        if not dry_run:
+        if not dry_run and _read_existing(target_path) == rendered:
+            # Same palette → same output: leave the file (and its mtime) alone
+            # so config watchers don't reload for nothing.
+            log.debug("Unchanged %s", target_path)
+        elif not dry_run:
             try:
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                parent = target_path.parent
+                if parent not in known_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    known_dirs.add(parent)
                 target_path.write_text(rendered, encoding="utf-8")
                 log.info("Rendered %s → %s", template_path.name, target_path)
             except OSError as exc:
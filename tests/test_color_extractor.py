@@ -1,6 +1,14 @@
 """Unit tests for the matugen → Palette mapping logic."""
 
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pawlette.extraction import matugen
 from pawlette.extraction.matugen import _map_matugen_to_palette
+from pawlette.extraction.native import extract_native
 
 
 FAKE_MATUGEN_OUTPUT = {
@@ -24,6 +32,49 @@ FAKE_MATUGEN_OUTPUT = {
     }
 }
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# extract_native() on fixtures/mandelbrot.jpg (1024x768, quality 75). Pinned so
+# that any change to how the image is decoded or downsampled (e.g. JPEG draft
+# mode) shows up as a palette diff rather than slipping through silently.
+MANDELBROT_NATIVE_PALETTE = {
+    "color_bg":              "#320709",
+    "color_bg_alt":          "#440a0c",
+    "color_surface":         "#5a0d10",
+    "color_surface_alt":     "#711014",
+    "color_text":            "#cdc137",
+    "color_text_muted":      "#877e22",
+    "color_text_subtle":     "#454111",
+    "color_primary":         "#ea7184",
+    "color_secondary":       "#df62d2",
+    "color_border_active":   "#ea7184",
+    "color_border_inactive": "#8b1419",
+    "color_cursor":          "#ea7184",
+    "color_selection_bg":    "#9c172c",
+    "ansi_color0":           "#320709",
+    "ansi_color1":           "#c81d39",
+    "ansi_color2":           "#c81db6",
+    "ansi_color3":           "#c88e1d",
+    "ansi_color4":           "#1dc854",
+    "ansi_color5":           "#39c81d",
+    "ansi_color6":           "#1dc8ad",
+    "ansi_color7":           "#cdc137",
+    "ansi_color8":           "#4d0b0e",
+    "ansi_color9":           "#e86379",
+    "ansi_color10":          "#e863da",
+    "ansi_color11":          "#e8bb63",
+    "ansi_color12":          "#63e88e",
+    "ansi_color13":          "#79e863",
+    "ansi_color14":          "#63e8d3",
+    "ansi_color15":          "#d5cb58",
+    "color_red":             "#e86363",
+    "color_green":           "#63e863",
+    "color_yellow":          "#e8e863",
+    "color_blue":            "#5277e6",
+    "color_cyan":            "#75e1eb",
+    "color_magenta":         "#e863e8",
+}
+
 
 def _lightness(hex_c: str) -> float:
     """HSL lightness in [0, 1] of a #rrggbb string."""
@@ -92,3 +143,50 @@ def test_bg_alt_is_darker_than_bg_light_mode():
     modes — this only exercises the sign of the derived step.)"""
     palette = _map_matugen_to_palette(FAKE_MATUGEN_OUTPUT, mode="light")
     assert _lightness(palette.color_bg_alt) < _lightness(palette.color_bg)
+
+
+def _bump_mtime(path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_matugen_output_is_cached_per_image(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    image = tmp_path / "wall.png"
+    image.write_bytes(b"not really a png")
+    binary = tmp_path / "matugen"
+    binary.write_bytes(b"v1")
+    monkeypatch.setattr(matugen.shutil, "which", lambda _name: str(binary))
+
+    run = MagicMock(
+        return_value=subprocess.CompletedProcess(
+            [], 0, stdout=json.dumps(FAKE_MATUGEN_OUTPUT).encode(), stderr=b""
+        )
+    )
+    monkeypatch.setattr(matugen.subprocess, "run", run)
+
+    first = matugen._run_matugen("image", str(image))
+    second = matugen._run_matugen("image", str(image))
+    assert first == second == FAKE_MATUGEN_OUTPUT
+    assert run.call_count == 1
+
+    # A different preference is a different command → cache miss
+    matugen._run_matugen("image", str(image), matugen_config={"prefer": "lightness"})
+    assert run.call_count == 2
+
+    # Touching the wallpaper invalidates the cached output
+    _bump_mtime(image)
+    matugen._run_matugen("image", str(image), matugen_config={"prefer": "lightness"})
+    assert run.call_count == 3
+
+    # So does upgrading matugen itself
+    binary.write_bytes(b"v2 is bigger")
+    _bump_mtime(binary)
+    matugen._run_matugen("image", str(image), matugen_config={"prefer": "lightness"})
+    assert run.call_count == 4
+    assert not (tmp_path / "cache" / "pawlette" / "matugen_output.json.tmp").exists()
+
+
+def test_extract_native_jpeg_palette_is_stable():
+    palette = extract_native(str(FIXTURES / "mandelbrot.jpg"))
+    assert palette.to_dict() == MANDELBROT_NATIVE_PALETTE
@@ -52,3 +52,30 @@ def test_non_executable_file_skipped(tmp_path):
     # Do NOT chmod +x
     results = run_plugins(_fake_palette(), tmp_path)
     assert results == {}
+
+
+def test_parallel_jobs_keep_results_per_plugin(tmp_path):
+    _make_plugin(tmp_path, "a.sh", "#!/bin/sh\nexit 0\n")
+    _make_plugin(tmp_path, "b.sh", "#!/bin/sh\nexit 1\n")
+    _make_plugin(tmp_path, "c.sh", "#!/bin/sh\nexit 0\n")
+    results = run_plugins(_fake_palette(), tmp_path, jobs=3)
+    assert list(results) == ["a.sh", "b.sh", "c.sh"]
+    assert results == {"a.sh": True, "b.sh": False, "c.sh": True}
+
+
+def test_plugin_receives_config_section(tmp_path):
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "pawlette.toml").write_text(
+        '[plugins.cfg_check]\noutput = "hello"\n[plugins.other]\noutput = "nope"\n'
+    )
+    out_file = tmp_path / "out.txt"
+    _make_plugin(
+        plugins_dir,
+        "cfg_check.sh",
+        f"#!/bin/sh\necho $PAWLETTE_PLUGIN_OUTPUT > {out_file}\n",
+    )
+    run_plugins(_fake_palette(), plugins_dir, config_dir)
+    assert out_file.read_text().strip() == "hello"
@@ -1,5 +1,6 @@
 """Unit tests for the template rendering engine."""
 
+import os
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -95,3 +96,33 @@ def test_apply_templates_writes_file(tmp_path: Path):
     target = tpl_dir / "config.ini"
     assert target.exists()
     assert "#1e1e2e" in target.read_text()
+
+
+def test_apply_templates_finds_nested_templates(tmp_path: Path):
+    for rel in ("b/deep/x.conf.pawlette", "a/y.conf.pawlette", "a/ignored.conf"):
+        f = tmp_path / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text("{{color_bg}}")
+
+    palette = MagicMock()
+    palette.to_dict.return_value = FAKE_PALETTE_DICT
+
+    written = apply_templates(palette, config_root=tmp_path, dry_run=True)
+    assert written == [tmp_path / "a" / "y.conf", tmp_path / "b" / "deep" / "x.conf"]
+
+
+def test_apply_templates_skips_unchanged_target(tmp_path: Path):
+    tpl_file = tmp_path / "kitty.conf.pawlette"
+    tpl_file.write_text("bg {{color_bg}}\n")
+    target = tmp_path / "kitty.conf"
+
+    palette = MagicMock()
+    palette.to_dict.return_value = FAKE_PALETTE_DICT
+
+    apply_templates(palette, config_root=tmp_path)
+    first_mtime = target.stat().st_mtime_ns
+    os.utime(target, ns=(first_mtime - 10**9, first_mtime - 10**9))
+
+    written = apply_templates(palette, config_root=tmp_path)
+    assert written == [target]
+    assert target.stat().st_mtime_ns == first_mtime - 10**9